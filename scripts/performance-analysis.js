@@ -40,13 +40,26 @@ const colors = {
   bold: '\x1b[1m'
 };
 
+// Output is buffered and flushed per section: one stdout write syscall per
+// batch instead of one per line. Section banners are flushed eagerly so the
+// user can see which step is running before any slow work starts.
+const outputBuffer = [];
+
 function log(message, color = 'reset') {
-  console.log(`${colors[color]}${message}${colors.reset}`);
+  outputBuffer.push(`${colors[color]}${message}${colors.reset}\n`);
+}
+
+function flushLog() {
+  if (outputBuffer.length === 0) return;
+  process.stdout.write(outputBuffer.join(''));
+  outputBuffer.length = 0;
 }
 
 function analyzeBundleSize() {
   log('\n📦 Analyzing Bundle Size...', 'blue');
-  
+  flushLog();
+
+
   try {
     const distPath = path.join(process.cwd(), 'dist');
     if (!fs.existsSync(distPath)) {
@@ -55,31 +68,29 @@ function analyzeBundleSize() {
     }
 
     const assetsPath = path.join(distPath, 'assets');
-    const jsFiles = fs.readdirSync(assetsPath)
-      .filter(file => file.endsWith('.js'))
-      .map(file => {
-        const filePath = path.join(assetsPath, file);
-        const stats = fs.statSync(filePath);
-        const sizeKB = Math.round(stats.size / 1024);
-        return { name: file, size: sizeKB, path: filePath };
-      });
 
     let totalSize = 0;
     let mainSize = 0;
     let vendorSize = 0;
 
-    jsFiles.forEach(file => {
-      totalSize += file.size;
-      
-      if (file.name.includes('index')) {
-        mainSize = file.size;
-      } else if (file.name.includes('vendor')) {
-        vendorSize = file.size;
+    // Single pass over the directory listing: stat, accumulate and report
+    // each file as we go instead of materializing intermediate arrays
+    for (const file of fs.readdirSync(assetsPath)) {
+      if (!file.endsWith('.js')) continue;
+
+      const stats = fs.statSync(path.join(assetsPath, file));
+      const sizeKB = Math.round(stats.size / 1024);
+      totalSize += sizeKB;
+
+      if (file.includes('index')) {
+        mainSize = sizeKB;
+      } else if (file.includes('vendor')) {
+        vendorSize = sizeKB;
       }
-      
-      const status = file.size > THRESHOLDS.bundleSize.main ? '❌' : '✅';
-      log(`  ${status} ${file.name}: ${file.size}KB`, file.size > THRESHOLDS.bundleSize.main ? 'red' : 'green');
-    });
+
+      const status = sizeKB > THRESHOLDS.bundleSize.main ? '❌' : '✅';
+      log(`  ${status} ${file}: ${sizeKB}KB`, sizeKB > THRESHOLDS.bundleSize.main ? 'red' : 'green');
+    }
 
     log(`\n📊 Bundle Size Summary:`, 'bold');
     log(`  Total: ${totalSize}KB ${totalSize > THRESHOLDS.bundleSize.total ? '❌' : '✅'}`, 
@@ -98,7 +109,9 @@ function analyzeBundleSize() {
 
 function analyzeLighthouse() {
   log('\n🏠 Running Lighthouse Analysis...', 'blue');
-  
+  flushLog();
+
+
   try {
     // Check if Lighthouse is installed
     try {
@@ -160,7 +173,9 @@ function analyzeLighthouse() {
 
 function analyzeDependencies() {
   log('\n📋 Analyzing Dependencies...', 'blue');
-  
+  flushLog();
+
+
   try {
     const packageJson = JSON.parse(fs.readFileSync('package.json', 'utf8'));
     const dependencies = { ...packageJson.dependencies, ...packageJson.devDependencies };
@@ -234,22 +249,28 @@ function generateReport(results) {
 
 function main() {
   log('🚀 Performance Analysis Starting...', 'bold');
-  
+  flushLog();
+
+
   // Check if development server is running
   try {
     execSync('curl -s http://localhost:5173 > /dev/null', { stdio: 'ignore' });
   } catch {
     log('❌ Development server not running. Start with: npm run dev', 'red');
+    flushLog();
     process.exit(1);
   }
 
-  const results = {
-    bundleSize: analyzeBundleSize(),
-    lighthouse: analyzeLighthouse(),
-    dependencies: analyzeDependencies()
-  };
+  const results = {};
+  results.bundleSize = analyzeBundleSize();
+  flushLog();
+  results.lighthouse = analyzeLighthouse();
+  flushLog();
+  results.dependencies = analyzeDependencies();
+  flushLog();
 
   generateReport(results);
+  flushLog();
 }
 
 if (require.main === module) {
@@ -260,5 +281,6 @@ module.exports = {
   analyzeBundleSize,
   analyzeLighthouse,
   analyzeDependencies,
-  generateReport
+  generateReport,
+  flushLog
 };
\ No newline at end of file
@@ -1,6 +1,6 @@
 import React, { Suspense, lazy } from 'react'
 import { Routes, Route } from 'react-router-dom'
-import { QueryClient, useQueryClient } from 'react-query'
+import { useQueryClient } from 'react-query'
 import LoadingSpinner from '@components/LoadingSpinner'
 import ErrorBoundary from '@components/ErrorBoundary'
 import Navigation from '@components/Navigation'
@@ -16,19 +16,18 @@ const Settings = lazy(() => import('@/pages/Settings'))
 const useAppPerformance = () => {
   const queryClient = useQueryClient()
   
-  // Monitor query cache performance
+  // Monitor query cache performance event-driven: the cache notifies on
+  // every add/remove, so there is no periodic wakeup while the app is idle
   React.useEffect(() => {
-    const interval = setInterval(() => {
-      const queries = queryClient.getQueryCache().getAll()
-      const cacheSize = queries.length
-      
+    const queryCache = queryClient.getQueryCache()
+    return queryCache.subscribe(() => {
+      const cacheSize = queryCache.getAll().length
+
       if (cacheSize > 100) {
         console.warn('Large query cache detected:', cacheSize, 'queries')
         // Implement cache cleanup if needed
       }
-    }, 30000) // Check every 30 seconds
-    
-    return () => clearInterval(interval)
+    })
   }, [queryClient])
 }
 
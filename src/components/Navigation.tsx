@@ -14,6 +14,22 @@ const navItems: NavItem[] = [
   { path: '/settings', label: 'Settings', icon: '⚙️' }
 ]
 
+// Route chunk prefetchers: hovering or focusing a link starts the lazy
+// chunk download so it overlaps user intent instead of blocking navigation
+const routePrefetchers: Record<string, () => Promise<unknown>> = {
+  '/': () => import('@/pages/Dashboard'),
+  '/automations': () => import('@/pages/AutomationList'),
+  '/settings': () => import('@/pages/Settings')
+}
+
+const prefetchedRoutes = new Set<string>()
+
+const prefetchRoute = (path: string) => {
+  if (prefetchedRoutes.has(path)) return
+  prefetchedRoutes.add(path)
+  routePrefetchers[path]?.()
+}
+
 const Navigation = memo(() => {
   const location = useLocation()
   usePerformanceMonitor('Navigation')
@@ -37,6 +53,8 @@ const Navigation = memo(() => {
             to="/" 
             className="flex items-center space-x-2 text-xl font-bold text-primary-600"
             onClick={() => handleNavClick('/')}
+            onMouseEnter={() => prefetchRoute('/')}
+            onFocus={() => prefetchRoute('/')}
           >
             <span className="text-2xl">🚀</span>
             <span>AI Auto</span>
@@ -49,6 +67,8 @@ const Navigation = memo(() => {
                 key={item.path}
                 to={item.path}
                 onClick={() => handleNavClick(item.path)}
+                onMouseEnter={() => prefetchRoute(item.path)}
+                onFocus={() => prefetchRoute(item.path)}
                 className={`flex items-center space-x-2 px-3 py-2 rounded-md text-sm font-medium transition-colors duration-200 ${
                   location.pathname === item.path
                     ? 'bg-primary-100 text-primary-700'
@@ -83,6 +103,8 @@ const Navigation = memo(() => {
                 key={item.path}
                 to={item.path}
                 onClick={() => handleNavClick(item.path)}
+                onMouseEnter={() => prefetchRoute(item.path)}
+                onFocus={() => prefetchRoute(item.path)}
                 className={`flex items-center space-x-2 px-3 py-2 rounded-md text-base font-medium ${
                   location.pathname === item.path
                     ? 'bg-primary-100 text-primary-700'
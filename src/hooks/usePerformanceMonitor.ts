@@ -1,4 +1,5 @@
-import { useEffect, useRef } from 'react'
+import { useCallback, useEffect, useRef } from 'react'
+import { queueAnalyticsEvent } from '@utils/analytics'
 
 interface PerformanceMetrics {
   componentName: string
@@ -8,8 +9,10 @@ interface PerformanceMetrics {
 }
 
 export const usePerformanceMonitor = (componentName: string) => {
-  const mountTimeRef = useRef<number>(Date.now())
+  const mountStartRef = useRef<number>(performance.now())
+  const mountDurationRef = useRef<number>(0)
   const renderCountRef = useRef<number>(0)
+  const nextRenderWarningRef = useRef<number>(10)
 
   useEffect(() => {
     const startTime = performance.now()
@@ -23,59 +26,57 @@ export const usePerformanceMonitor = (componentName: string) => {
         console.log(`[Performance] ${componentName} render:`, renderTime.toFixed(2), 'ms')
       }
       
-      // Send to analytics in production
-      if (process.env.NODE_ENV === 'production' && window.gtag) {
-        window.gtag('event', 'component_render', {
-          event_category: 'Performance',
-          event_label: componentName,
-          value: Math.round(renderTime)
-        })
-      }
+      // Send to analytics in production (queued off the render path)
+      queueAnalyticsEvent('component_render', {
+        event_category: 'Performance',
+        event_label: componentName,
+        value: Math.round(renderTime)
+      })
     }
   })
 
-  // Track component mount time
+  // Track component mount time (measured once; later renders reuse the value
+  // instead of re-reading the clock)
   useEffect(() => {
-    const mountTime = Date.now() - mountTimeRef.current
-    
+    const mountTime = Math.round(performance.now() - mountStartRef.current)
+    mountDurationRef.current = mountTime
+
     if (process.env.NODE_ENV === 'development') {
       console.log(`[Performance] ${componentName} mount:`, mountTime, 'ms')
     }
     
-    if (process.env.NODE_ENV === 'production' && window.gtag) {
-      window.gtag('event', 'component_mount', {
-        event_category: 'Performance',
-        event_label: componentName,
-        value: mountTime
-      })
-    }
+    queueAnalyticsEvent('component_mount', {
+      event_category: 'Performance',
+      event_label: componentName,
+      value: mountTime
+    })
   }, [componentName])
 
-  // Track render count for debugging
+  // Track render count for debugging; warn only when the count crosses a
+  // doubling threshold (10, 20, 40, ...) instead of on every render past 10
   useEffect(() => {
     renderCountRef.current += 1
-    
-    if (process.env.NODE_ENV === 'development' && renderCountRef.current > 10) {
+
+    if (process.env.NODE_ENV === 'development' && renderCountRef.current >= nextRenderWarningRef.current) {
       console.warn(`[Performance] ${componentName} has rendered ${renderCountRef.current} times`)
+      nextRenderWarningRef.current *= 2
     }
   })
 
   return {
     renderCount: renderCountRef.current,
-    mountTime: Date.now() - mountTimeRef.current
+    mountTime: mountDurationRef.current
   }
 }
 
 // Hook for tracking user interactions
 export const useInteractionTracker = (componentName: string) => {
   const trackInteraction = (action: string, data?: any) => {
-    if (process.env.NODE_ENV === 'production' && window.gtag) {
-      window.gtag('event', 'user_interaction', {
-        event_category: 'Interaction',
-        event_label: `${componentName}:${action}`,
-        custom_parameters: data
-      })
-    }
+    queueAnalyticsEvent('user_interaction', {
+      event_category: 'Interaction',
+      event_label: `${componentName}:${action}`,
+      custom_parameters: data
+    })
   }
 
   return { trackInteraction }
@@ -83,7 +84,8 @@ export const useInteractionTracker = (componentName: string) => {
 
 // Hook for measuring function execution time
 export const usePerformanceTimer = () => {
-  const measureFunction = <T extends (...args: any[]) => any>(
+  // Stable identity so callers can memoize wrapped functions against it
+  const measureFunction = useCallback(<T extends (...args: any[]) => any>(
     fn: T,
     functionName: string
   ): T => {
@@ -97,17 +99,15 @@ export const usePerformanceTimer = () => {
         console.log(`[Performance] ${functionName} execution:`, executionTime.toFixed(2), 'ms')
       }
       
-      if (process.env.NODE_ENV === 'production' && window.gtag) {
-        window.gtag('event', 'function_execution', {
-          event_category: 'Performance',
-          event_label: functionName,
-          value: Math.round(executionTime)
-        })
-      }
+      queueAnalyticsEvent('function_execution', {
+        event_category: 'Performance',
+        event_label: functionName,
+        value: Math.round(executionTime)
+      })
       
       return result
     }) as T
-  }
+  }, [])
 
   return { measureFunction }
 }
\ No newline at end of file
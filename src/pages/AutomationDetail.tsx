@@ -5,10 +5,11 @@ import { FixedSizeList as List } from 'react-window'
 import { usePerformanceMonitor } from '@hooks/usePerformanceMonitor'
 import { fetchAutomation, fetchAutomationLogs } from '@utils/api'
 import { formatNumber, formatDate, formatDuration, formatLogLevel } from '@utils/formatters'
+import { LogEntry as AutomationLog } from '@/types'
 
 // Memoized log entry component
 const LogEntry = memo<{
-  log: any
+  log: AutomationLog
 }>(({ log }) => {
   const { text: levelText, className: levelClassName } = formatLogLevel(log.level)
   
@@ -36,7 +37,7 @@ LogEntry.displayName = 'LogEntry'
 const VirtualizedLogItem = memo<{
   index: number
   style: React.CSSProperties
-  data: any[]
+  data: AutomationLog[]
 }>(({ index, style, data }) => {
   const log = data[index]
   
@@ -49,16 +50,17 @@ const VirtualizedLogItem = memo<{
 
 VirtualizedLogItem.displayName = 'VirtualizedLogItem'
 
+// Status display config, built once at module load instead of per render
+const statusConfig = {
+  running: { color: 'bg-green-500', text: 'Running', icon: '▶️' },
+  stopped: { color: 'bg-red-500', text: 'Stopped', icon: '⏹️' },
+  paused: { color: 'bg-yellow-500', text: 'Paused', icon: '⏸️' }
+}
+
 // Memoized status indicator
 const StatusIndicator = memo<{
   status: string
 }>(({ status }) => {
-  const statusConfig = {
-    running: { color: 'bg-green-500', text: 'Running', icon: '▶️' },
-    stopped: { color: 'bg-red-500', text: 'Stopped', icon: '⏹️' },
-    paused: { color: 'bg-yellow-500', text: 'Paused', icon: '⏸️' }
-  }
-  
   const config = statusConfig[status as keyof typeof statusConfig] || statusConfig.stopped
   
   return (
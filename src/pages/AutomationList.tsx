@@ -1,14 +1,16 @@
 import React, { memo, useState, useMemo, useCallback } from 'react'
+import { useNavigate } from 'react-router-dom'
 import { useQuery } from 'react-query'
 import { FixedSizeList as List } from 'react-window'
 import { usePerformanceMonitor } from '@hooks/usePerformanceMonitor'
 import { fetchRecentAutomations } from '@utils/api'
 import { formatNumber, formatDate, formatStatus } from '@utils/formatters'
+import { Automation } from '@/types'
 import { debounce } from 'lodash-es'
 
 // Memoized automation card component
 const AutomationCard = memo<{
-  automation: any
+  automation: Automation
   onSelect: (id: string) => void
 }>(({ automation, onSelect }) => (
   <div 
@@ -55,7 +57,7 @@ AutomationCard.displayName = 'AutomationCard'
 const VirtualizedAutomationItem = memo<{
   index: number
   style: React.CSSProperties
-  data: { automations: any[]; onSelect: (id: string) => void }
+  data: { automations: Automation[]; onSelect: (id: string) => void }
 }>(({ index, style, data }) => {
   const automation = data.automations[index]
   
@@ -71,9 +73,20 @@ const VirtualizedAutomationItem = memo<{
 
 VirtualizedAutomationItem.displayName = 'VirtualizedAutomationItem'
 
+// Sort comparators keyed by sort mode, so selecting one is a single lookup
+// instead of re-running a switch on every comparison ('lastRun' is handled
+// separately because it needs the precomputed timestamp map)
+const sortComparators: Record<string, (a: Automation, b: Automation) => number> = {
+  name: (a, b) => a.name.localeCompare(b.name),
+  status: (a, b) => a.status.localeCompare(b.status),
+  executions: (a, b) => b.executions - a.executions,
+  successRate: (a, b) => b.successRate - a.successRate
+}
+
 const AutomationList = () => {
   usePerformanceMonitor('AutomationList')
-  
+
+  const navigate = useNavigate()
   const [searchQuery, setSearchQuery] = useState('')
   const [statusFilter, setStatusFilter] = useState('all')
   const [sortBy, setSortBy] = useState('name')
@@ -88,43 +101,48 @@ const AutomationList = () => {
     }
   )
 
+  // Precomputed search index: lowercase each row once per dataset instead of
+  // re-lowercasing name and description on every keystroke
+  const searchIndex = useMemo(
+    () => automations.map(automation =>
+      `${automation.name} ${automation.description}`.toLowerCase()
+    ),
+    [automations]
+  )
+
+  // Numeric lastRun timestamps parsed once per dataset, so sorting compares
+  // numbers instead of constructing two Date objects per comparison
+  const lastRunTimes = useMemo(() => {
+    const times = new Map<string, number>()
+    for (const automation of automations) {
+      times.set(automation.id, new Date(automation.lastRun).getTime())
+    }
+    return times
+  }, [automations])
+
   // Memoized filtered and sorted automations
   const filteredAutomations = useMemo(() => {
-    let filtered = automations
+    const query = searchQuery ? searchQuery.toLowerCase() : null
+    const status = statusFilter !== 'all' ? statusFilter : null
 
-    // Apply search filter
-    if (searchQuery) {
-      filtered = filtered.filter(automation =>
-        automation.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        automation.description.toLowerCase().includes(searchQuery.toLowerCase())
+    // Apply search (against the precomputed index) and status filters in a
+    // single pass instead of materializing an intermediate array per filter
+    let filtered = automations
+    if (query !== null || status !== null) {
+      filtered = automations.filter((automation, index) =>
+        (query === null || searchIndex[index].includes(query)) &&
+        (status === null || automation.status === status)
       )
     }
 
-    // Apply status filter
-    if (statusFilter !== 'all') {
-      filtered = filtered.filter(automation => automation.status === statusFilter)
-    }
+    // Apply sorting via the comparator table; copy first so the shared
+    // react-query cache array is never sorted in place
+    const comparator = sortBy === 'lastRun'
+      ? (a: Automation, b: Automation) => (lastRunTimes.get(b.id) ?? 0) - (lastRunTimes.get(a.id) ?? 0)
+      : sortComparators[sortBy]
 
-    // Apply sorting
-    filtered.sort((a, b) => {
-      switch (sortBy) {
-        case 'name':
-          return a.name.localeCompare(b.name)
-        case 'status':
-          return a.status.localeCompare(b.status)
-        case 'executions':
-          return b.executions - a.executions
-        case 'lastRun':
-          return new Date(b.lastRun).getTime() - new Date(a.lastRun).getTime()
-        case 'successRate':
-          return b.successRate - a.successRate
-        default:
-          return 0
-      }
-    })
-
-    return filtered
-  }, [automations, searchQuery, statusFilter, sortBy])
+    return comparator ? filtered.slice().sort(comparator) : filtered
+  }, [automations, searchIndex, lastRunTimes, searchQuery, statusFilter, sortBy])
 
   // Debounced search handler
   const handleSearch = useCallback(
@@ -136,9 +154,16 @@ const AutomationList = () => {
 
   // Handle automation selection
   const handleAutomationSelect = useCallback((id: string) => {
-    // Navigate to automation detail page
-    window.location.href = `/automations/${id}`
-  }, [])
+    // Client-side navigation keeps the app, query cache and loaded chunks alive
+    navigate(`/automations/${id}`)
+  }, [navigate])
+
+  // Stable itemData reference so react-window rows only re-render when the
+  // list itself changes, not on every parent render
+  const itemData = useMemo(
+    () => ({ automations: filteredAutomations, onSelect: handleAutomationSelect }),
+    [filteredAutomations, handleAutomationSelect]
+  )
 
   // Virtual list configuration
   const ITEM_SIZE = 120
@@ -223,7 +248,7 @@ const AutomationList = () => {
               height={LIST_HEIGHT}
               itemCount={filteredAutomations.length}
               itemSize={ITEM_SIZE}
-              itemData={{ automations: filteredAutomations, onSelect: handleAutomationSelect }}
+              itemData={itemData}
               className="scrollbar-thin scrollbar-thumb-gray-300 scrollbar-track-gray-100"
             >
               {VirtualizedAutomationItem}
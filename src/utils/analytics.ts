@@ -0,0 +1,65 @@
+// Deferred analytics dispatch: events are queued on the hot path and flushed
+// to gtag during browser idle time, so measurement never competes with
+// rendering or data fetching for the main thread
+
+interface AnalyticsEvent {
+  name: string
+  params: Record<string, any>
+}
+
+const MAX_QUEUE_SIZE = 1000
+
+const queue: AnalyticsEvent[] = []
+let flushScheduled = false
+let droppedEvents = 0
+
+const flush = () => {
+  flushScheduled = false
+
+  if (!window.gtag) {
+    queue.length = 0
+    return
+  }
+
+  for (const event of queue) {
+    window.gtag('event', event.name, event.params)
+  }
+  queue.length = 0
+
+  // Surface overflow so dropped measurements are visible to operators
+  if (droppedEvents > 0) {
+    window.gtag('event', 'analytics_events_dropped', {
+      event_category: 'Analytics',
+      value: droppedEvents
+    })
+    droppedEvents = 0
+  }
+}
+
+const scheduleFlush = () => {
+  if (flushScheduled) return
+  flushScheduled = true
+
+  if (typeof requestIdleCallback === 'function') {
+    requestIdleCallback(() => flush(), { timeout: 2000 })
+  } else {
+    setTimeout(flush, 250)
+  }
+}
+
+// Flush whatever is pending before the page goes away
+window.addEventListener('pagehide', flush)
+
+// Queue an analytics event for idle-time delivery. No-ops outside production
+// so development hot paths pay nothing.
+export const queueAnalyticsEvent = (name: string, params: Record<string, any>) => {
+  if (process.env.NODE_ENV !== 'production') return
+
+  if (queue.length >= MAX_QUEUE_SIZE) {
+    droppedEvents += 1
+    return
+  }
+
+  queue.push({ name, params })
+  scheduleFlush()
+}
@@ -1,3 +1,6 @@
+import { queueAnalyticsEvent } from './analytics'
+import { Automation, AutomationConfig, DashboardData, LogEntry, LogsResponse, Settings } from '@/types'
+
 // API base configuration
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'https://api.example.com'
 const API_TIMEOUT = 10000 // 10 seconds
@@ -5,23 +8,53 @@ const API_TIMEOUT = 10000 // 10 seconds
 // Request cache for deduplication
 const requestCache = new Map<string, Promise<any>>()
 
-// Performance monitoring
+// Time constants for the simulated data generators, hoisted so the per-row
+// expressions below do a single multiply instead of rebuilding the product
+const DAY_MS = 24 * 60 * 60 * 1000
+const WEEK_MS = 7 * DAY_MS
+const MONTH_MS = 30 * DAY_MS
+
+// Short-lived response cache so bursts of identical GETs collapse into one fetch
+const responseCache = new Map<string, { data: any; expires: number }>()
+const RESPONSE_CACHE_TTL = 10000 // 10 seconds
+
+// Normalize endpoint labels so analytics cardinality stays bounded: drop
+// query strings and collapse id-bearing path segments into ':id'
+const normalizeEndpoint = (endpoint: string): string =>
+  endpoint.split('?', 1)[0].replace(/\/[^/]*\d[^/]*/g, '/:id')
+
+// Performance monitoring (queued; delivery happens off the request path)
 const trackApiCall = (endpoint: string, duration: number, success: boolean) => {
-  if (process.env.NODE_ENV === 'production' && window.gtag) {
-    window.gtag('event', 'api_call', {
-      event_category: 'API',
-      event_label: endpoint,
-      value: Math.round(duration),
-      custom_parameters: { success }
-    })
-  }
+  queueAnalyticsEvent('api_call', {
+    event_category: 'API',
+    event_label: normalizeEndpoint(endpoint),
+    value: Math.round(duration),
+    custom_parameters: { success }
+  })
 }
 
 // Optimized fetch wrapper with caching and timeout
 const apiFetch = async (endpoint: string, options: RequestInit = {}) => {
   const url = `${API_BASE_URL}${endpoint}`
-  const cacheKey = `${options.method || 'GET'}:${url}:${JSON.stringify(options.body || '')}`
-  
+  const method = options.method || 'GET'
+  // Skip body serialization for the common body-less case; fetch bodies are
+  // usually pre-stringified JSON, so reuse them as-is instead of re-encoding
+  const cacheKey = options.body
+    ? `${method}:${url}:${typeof options.body === 'string' ? options.body : JSON.stringify(options.body)}`
+    : `${method}:${url}`
+
+  // Serve recent GET responses from cache to avoid redundant round trips
+  if (method === 'GET') {
+    const cached = responseCache.get(cacheKey)
+    if (cached) {
+      if (cached.expires > Date.now()) {
+        return cached.data
+      }
+      // Expired: evict now so stale payloads don't pin memory for the tab's life
+      responseCache.delete(cacheKey)
+    }
+  }
+
   // Check if request is already in progress
   if (requestCache.has(cacheKey)) {
     return requestCache.get(cacheKey)
@@ -49,7 +82,11 @@ const apiFetch = async (endpoint: string, options: RequestInit = {}) => {
     const data = await response.json()
     const duration = performance.now() - startTime
     trackApiCall(endpoint, duration, true)
-    
+
+    if (method === 'GET') {
+      responseCache.set(cacheKey, { data, expires: Date.now() + RESPONSE_CACHE_TTL })
+    }
+
     return data
   }).catch((error) => {
     clearTimeout(timeoutId)
@@ -69,8 +106,18 @@ const apiFetch = async (endpoint: string, options: RequestInit = {}) => {
   return fetchPromise
 }
 
+// Value pools for the simulated data generators, typed against the shared
+// interfaces so the fetchers' declared return types hold up under strict mode
+const AUTOMATION_STATUSES: Automation['status'][] = ['running', 'stopped', 'paused']
+const LOG_LEVELS: LogEntry['level'][] = ['info', 'warning', 'error']
+const DEFAULT_AUTOMATION_CONFIG: AutomationConfig = {
+  triggers: ['schedule', 'webhook'],
+  actions: ['email', 'database', 'api'],
+  schedule: '0 */6 * * *'
+}
+
 // Dashboard API
-export const fetchDashboardData = async () => {
+export const fetchDashboardData = async (): Promise<DashboardData> => {
   // Simulate API call with realistic data
   await new Promise(resolve => setTimeout(resolve, 200 + Math.random() * 300))
   
@@ -86,25 +133,27 @@ export const fetchDashboardData = async () => {
   }
 }
 
-export const fetchRecentAutomations = async () => {
+export const fetchRecentAutomations = async (): Promise<Automation[]> => {
   // Simulate API call with realistic data
   await new Promise(resolve => setTimeout(resolve, 150 + Math.random() * 200))
-  
+
+  const now = Date.now() // Read the clock once instead of per row
   return Array.from({ length: 50 }, (_, i) => ({
     id: `auto-${i + 1}`,
     name: `Automation ${i + 1}`,
     description: `Automated process for task ${i + 1}`,
-    status: ['running', 'stopped', 'paused'][Math.floor(Math.random() * 3)],
+    status: AUTOMATION_STATUSES[Math.floor(Math.random() * 3)],
     executions: Math.floor(Math.random() * 1000) + 10,
-    lastRun: new Date(Date.now() - Math.random() * 7 * 24 * 60 * 60 * 1000).toISOString(),
-    successRate: Math.floor(Math.random() * 20) + 80
+    lastRun: new Date(now - Math.random() * WEEK_MS).toISOString(),
+    successRate: Math.floor(Math.random() * 20) + 80,
+    config: DEFAULT_AUTOMATION_CONFIG
   }))
 }
 
 // Automation API
-export const fetchAutomation = async (id: string) => {
+export const fetchAutomation = async (id: string): Promise<Automation> => {
   await new Promise(resolve => setTimeout(resolve, 100 + Math.random() * 150))
-  
+
   return {
     id,
     name: `Automation ${id}`,
@@ -113,22 +162,19 @@ export const fetchAutomation = async (id: string) => {
     executions: Math.floor(Math.random() * 1000) + 10,
     lastRun: new Date().toISOString(),
     successRate: Math.floor(Math.random() * 20) + 80,
-    config: {
-      triggers: ['schedule', 'webhook'],
-      actions: ['email', 'database', 'api'],
-      schedule: '0 */6 * * *'
-    }
+    config: DEFAULT_AUTOMATION_CONFIG
   }
 }
 
-export const fetchAutomationLogs = async (id: string, page = 1, limit = 20) => {
+export const fetchAutomationLogs = async (id: string, page = 1, limit = 20): Promise<LogsResponse> => {
   await new Promise(resolve => setTimeout(resolve, 100 + Math.random() * 100))
-  
+
+  const now = Date.now() // Read the clock once instead of per row
   return {
     logs: Array.from({ length: limit }, (_, i) => ({
       id: `log-${page}-${i}`,
-      timestamp: new Date(Date.now() - Math.random() * 30 * 24 * 60 * 60 * 1000).toISOString(),
-      level: ['info', 'warning', 'error'][Math.floor(Math.random() * 3)],
+      timestamp: new Date(now - Math.random() * MONTH_MS).toISOString(),
+      level: LOG_LEVELS[Math.floor(Math.random() * 3)],
       message: `Log message ${page}-${i}`,
       executionTime: Math.floor(Math.random() * 5000) + 100
     })),
@@ -139,7 +185,7 @@ export const fetchAutomationLogs = async (id: string, page = 1, limit = 20) => {
 }
 
 // Settings API
-export const fetchSettings = async () => {
+export const fetchSettings = async (): Promise<Settings> => {
   await new Promise(resolve => setTimeout(resolve, 50 + Math.random() * 100))
   
   return {
@@ -169,6 +215,7 @@ export const updateSettings = async (settings: any) => {
 // Utility function to clear request cache
 export const clearApiCache = () => {
   requestCache.clear()
+  responseCache.clear()
 }
 
 // Export the base fetch function for custom requests
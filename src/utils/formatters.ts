@@ -32,11 +32,7 @@ export const formatDate = memoize((dateString: string): string => {
     day: 'numeric',
     year: 'numeric'
   })
-}, (dateString: string) => {
-  // Cache by day to avoid excessive cache entries
-  const date = new Date(dateString)
-  return `${date.getFullYear()}-${date.getMonth()}-${date.getDate()}`
-})
+}, (dateString: string) => dateString.slice(0, 10)) // Cache by day (ISO date part) without re-parsing
 
 // Memoized duration formatter
 export const formatDuration = memoize((milliseconds: number): string => {
@@ -52,53 +48,71 @@ export const formatDuration = memoize((milliseconds: number): string => {
   return `${Math.floor(milliseconds / 3600000)}h ${Math.floor((milliseconds % 3600000) / 60000)}m`
 }, (milliseconds: number) => Math.floor(milliseconds / 1000)) // Cache by seconds
 
+// File size units and the log divisor, computed once instead of per call
+const FILE_SIZE_UNITS = ['Bytes', 'KB', 'MB', 'GB', 'TB']
+const LOG_1024 = Math.log(1024)
+
+const fileSizeMagnitude = (bytes: number): number => Math.floor(Math.log(bytes) / LOG_1024)
+
 // Memoized file size formatter
 export const formatFileSize = memoize((bytes: number): string => {
   if (bytes === 0) return '0 Bytes'
-  
-  const k = 1024
-  const sizes = ['Bytes', 'KB', 'MB', 'GB', 'TB']
-  const i = Math.floor(Math.log(bytes) / Math.log(k))
-  
-  return `${parseFloat((bytes / Math.pow(k, i)).toFixed(2))} ${sizes[i]}`
-}, (bytes: number) => Math.floor(Math.log(bytes) / Math.log(1024)))
+
+  const i = fileSizeMagnitude(bytes)
+
+  return `${parseFloat((bytes / Math.pow(1024, i)).toFixed(2))} ${FILE_SIZE_UNITS[i]}`
+}, fileSizeMagnitude)
 
 // Memoized percentage formatter
 export const formatPercentage = memoize((value: number, decimals = 1): string => {
   return `${value.toFixed(decimals)}%`
 }, (value: number, decimals = 1) => `${Math.round(value * Math.pow(10, decimals))}-${decimals}`)
 
+// Reusable Intl.NumberFormat instances: constructing one is far more
+// expensive than calling format, so keep one per currency
+const currencyFormatters = new Map<string, Intl.NumberFormat>()
+
+const getCurrencyFormatter = (currency: string): Intl.NumberFormat => {
+  let formatter = currencyFormatters.get(currency)
+  if (!formatter) {
+    formatter = new Intl.NumberFormat('en-US', {
+      style: 'currency',
+      currency
+    })
+    currencyFormatters.set(currency, formatter)
+  }
+  return formatter
+}
+
 // Memoized currency formatter
 export const formatCurrency = memoize((amount: number, currency = 'USD'): string => {
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency
-  }).format(amount)
+  return getCurrencyFormatter(currency).format(amount)
 }, (amount: number, currency = 'USD') => `${Math.round(amount * 100)}-${currency}`)
 
+// Constant lookup tables, built once at module load instead of per call
+const statusMap: Record<string, string> = {
+  running: 'Running',
+  stopped: 'Stopped',
+  paused: 'Paused',
+  error: 'Error',
+  success: 'Success',
+  pending: 'Pending'
+}
+
+const levelMap: Record<string, { text: string; className: string }> = {
+  info: { text: 'INFO', className: 'text-blue-600 bg-blue-50' },
+  warning: { text: 'WARN', className: 'text-yellow-600 bg-yellow-50' },
+  error: { text: 'ERROR', className: 'text-red-600 bg-red-50' },
+  debug: { text: 'DEBUG', className: 'text-gray-600 bg-gray-50' }
+}
+
 // Memoized status formatter
 export const formatStatus = memoize((status: string): string => {
-  const statusMap: Record<string, string> = {
-    running: 'Running',
-    stopped: 'Stopped',
-    paused: 'Paused',
-    error: 'Error',
-    success: 'Success',
-    pending: 'Pending'
-  }
-  
   return statusMap[status] || status
 })
 
 // Memoized log level formatter with color classes
 export const formatLogLevel = memoize((level: string): { text: string; className: string } => {
-  const levelMap: Record<string, { text: string; className: string }> = {
-    info: { text: 'INFO', className: 'text-blue-600 bg-blue-50' },
-    warning: { text: 'WARN', className: 'text-yellow-600 bg-yellow-50' },
-    error: { text: 'ERROR', className: 'text-red-600 bg-red-50' },
-    debug: { text: 'DEBUG', className: 'text-gray-600 bg-gray-50' }
-  }
-  
   return levelMap[level] || { text: level.toUpperCase(), className: 'text-gray-600 bg-gray-50' }
 })
 
@@ -125,7 +139,4 @@ export const formatRelativeTime = memoize((dateString: string): string => {
   }
   
   return date.toLocaleDateString()
-}, (dateString: string) => {
-  const date = new Date(dateString)
-  return `${date.getFullYear()}-${date.getMonth()}-${date.getDate()}`
-})
\ No newline at end of file
+}, (dateString: string) => dateString.slice(0, 10)) // Cache by day (ISO date part) without re-parsing
\ No newline at end of file